@@ -1,9 +1,25 @@
+import re
+
 from qgis.PyQt.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QComboBox, QDialogButtonBox,
-    QLineEdit, QGroupBox, QHBoxLayout, QRadioButton, QButtonGroup
+    QLineEdit, QGroupBox, QHBoxLayout, QRadioButton, QButtonGroup,
+    QCheckBox
 )
 from qgis.core import QgsCoordinateReferenceSystem
 
+# Combo label to delimiter character
+_DELIM_MAP = {
+    "Comma (,)": ",",
+    "Semicolon (;)": ";",
+    "Tab": "\t",
+    "Pipe (|)": "|",
+}
+
+# Precompiled column-name patterns for geometry auto-detection
+_X_COLUMN_RE = re.compile(r'x|longitude|lon|lng|easting', re.IGNORECASE)
+_Y_COLUMN_RE = re.compile(r'y|latitude|lat|northing', re.IGNORECASE)
+_WKT_COLUMN_RE = re.compile(r'wkt|geometry|geom|shape|the_geom', re.IGNORECASE)
+
 class CsvSettingsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -35,6 +51,11 @@ class CsvSettingsDialog(QDialog):
         ])
         self.geometry_combo.setCurrentIndex(0)
         layout.addWidget(self.geometry_combo)
+
+        # Cache combo indices for auto-detection - the items never change
+        self._no_geometry_index = self.geometry_combo.findText("No geometry")
+        self._wkt_geometry_index = self.geometry_combo.findText("WKT Geometry")
+        self._xy_geometry_index = self.geometry_combo.findText("Point (X/Y columns)")
         
         # WKT column selection
         self.wkt_column_label = QLabel("WKT Column:")
@@ -82,6 +103,12 @@ class CsvSettingsDialog(QDialog):
         
         crs_group.setLayout(crs_layout)
         layout.addWidget(crs_group)
+
+        # Editable copy option - off by default so the common read-only case
+        # skips the second full parse into a memory layer
+        self.editable_checkbox = QCheckBox("Load as editable memory layer")
+        self.editable_checkbox.setChecked(False)
+        layout.addWidget(self.editable_checkbox)
         
         # Connect signals
         self.geometry_combo.currentTextChanged.connect(self.update_geometry_options)
@@ -134,12 +161,7 @@ class CsvSettingsDialog(QDialog):
     
     def get_delimiter(self):
         """Return the selected delimiter character"""
-        text = self.delimiter_combo.currentText()
-        if text == "Comma (,)": return ","
-        if text == "Semicolon (;)": return ";"
-        if text == "Tab": return "\t"
-        if text == "Pipe (|)": return "|"
-        return ","
+        return _DELIM_MAP.get(self.delimiter_combo.currentText(), ",")
     
     def get_encoding(self):
         """Return the selected encoding"""
@@ -181,40 +203,29 @@ class CsvSettingsDialog(QDialog):
         wkt_cols = []
         
         for col in cleaned_columns:
-            col_lower = col.lower()
-            
             # Check for X/Y coordinate columns
-            if any(x in col_lower for x in ['x', 'longitude', 'lon', 'lng', 'easting']):
+            if _X_COLUMN_RE.search(col):
                 x_cols.append(col)
-            elif any(x in col_lower for x in ['y', 'latitude', 'lat', 'northing']):
+            elif _Y_COLUMN_RE.search(col):
                 y_cols.append(col)
-            
+
             # Check for WKT/geometry columns
-            if any(x in col_lower for x in ['wkt', 'geometry', 'geom', 'shape', 'the_geom']):
+            if _WKT_COLUMN_RE.search(col):
                 wkt_cols.append(col)
-        
+
         # Set geometry type and columns based on detection
         if wkt_cols:
             # Prefer WKT if available
-            for i in range(self.geometry_combo.count()):
-                if "WKT Geometry" in self.geometry_combo.itemText(i):
-                    self.geometry_combo.setCurrentIndex(i)
-                    self.wkt_column_combo.setCurrentText(wkt_cols[0])
-                    break
+            self.geometry_combo.setCurrentIndex(self._wkt_geometry_index)
+            self.wkt_column_combo.setCurrentText(wkt_cols[0])
         elif x_cols and y_cols:
             # Use X/Y if no WKT but coordinates found
-            for i in range(self.geometry_combo.count()):
-                if "X/Y columns" in self.geometry_combo.itemText(i):
-                    self.geometry_combo.setCurrentIndex(i)
-                    self.x_column_combo.setCurrentText(x_cols[0])
-                    self.y_column_combo.setCurrentText(y_cols[0])
-                    break
+            self.geometry_combo.setCurrentIndex(self._xy_geometry_index)
+            self.x_column_combo.setCurrentText(x_cols[0])
+            self.y_column_combo.setCurrentText(y_cols[0])
         else:
             # Default to no geometry if nothing detected
-            for i in range(self.geometry_combo.count()):
-                if "No geometry" in self.geometry_combo.itemText(i):
-                    self.geometry_combo.setCurrentIndex(i)
-                    break
+            self.geometry_combo.setCurrentIndex(self._no_geometry_index)
     
     def get_x_column(self):
         return self.x_column_combo.currentText()